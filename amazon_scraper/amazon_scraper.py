@@ -1,13 +1,21 @@
 # pylint: disable=broad-exception-caught
 import csv
+import functools
+import json
+import queue
+import re
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Literal, Sequence
+from typing import Any, Iterable, Literal, Sequence
 from urllib.parse import urlparse
 
 import requests
 from loguru import logger
-from selenium.common.exceptions import NoSuchElementException
+from requests.adapters import HTTPAdapter, Retry
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -16,7 +24,38 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
 
 from amazon_scraper import scrape_utility as su
-from amazon_scraper.configuration import ConfigValue  # type: ignore
+from amazon_scraper.configuration import ConfigStore, ConfigValue  # type: ignore
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=4)
+def _selectors_for(context: str, version: int) -> dict[str, Any]:  # pylint: disable=unused-argument
+    """Resolve the selectors config once per config-store state. The arguments only key the cache; a configure_context call bumps the version and the next lookup re-resolves, mirroring ConfigValue.resolve."""
+    return ConfigValue("selectors").resolve() or {}
+
+
+def _selectors() -> dict[str, Any]:
+    """Resolve the selectors config, memoized until the config context changes."""
+    return _selectors_for(ConfigStore.context, ConfigStore.version)
+
+
+# Upper bound on concurrent image downloads; the adapter pool is sized to match so
+# every download thread gets a persistent connection instead of opening its own.
+_MAX_DOWNLOAD_WORKERS: int = 16
+
+_SESSION: requests.Session = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_MAX_DOWNLOAD_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
 
 
 def get_search_result_pages(
@@ -56,15 +95,20 @@ def get_search_result_pages(
         number_of_pages = min(number_of_pages, max_search_result_pages) if max_search_result_pages else number_of_pages
         logger.info(f"Max search result pages set to {max_search_result_pages}. Returning {number_of_pages} pages")
 
-        pages: list[str] = (
-            [driver.current_url]
-            + [
-                f"{driver.current_url.replace('nb_sb_noss', f'sr_pg_{p}')}&page={p+1}"
-                for p in range(1, number_of_pages)
-            ]
-            if number_of_pages > 1
-            else [driver.current_url]
+        # Read the real next-page URLs from the pagination anchors instead of string-manipulating
+        # the current URL, which does not survive Amazon's frequent URL-schema changes.
+        hrefs: list[str] = (
+            driver.execute_script(
+                "return Array.from(document.querySelectorAll('.s-pagination-item[href]')).map(a => a.href);"
+            )  # type: ignore[no-untyped-call]
+            or []
         )
+
+        pages: list[str] = [driver.current_url]
+        for href in hrefs:
+            if href not in pages:
+                pages.append(href)
+        pages = pages[:number_of_pages]
     except NoSuchElementException:
         logger.info("Found only one page.")
         pages = [driver.current_url]
@@ -74,8 +118,50 @@ def get_search_result_pages(
     return pages
 
 
+_EXTRACT_PRODUCTS_JS: str = """
+const [productsSelector, fieldSelectors] = arguments;
+const first = (root, sels) => {
+    for (const s of sels) {
+        const e = root.querySelector(s);
+        if (e) return e;
+    }
+    return null;
+};
+return Array.from(document.querySelectorAll(productsSelector)).map(e => ({
+    title: first(e, fieldSelectors.title)?.textContent ?? null,
+    price: first(e, fieldSelectors.price)?.innerText ?? null,
+    url: first(e, fieldSelectors.url)?.href ?? null,
+    asin: e.getAttribute('data-asin'),
+    is_sponsored: !!first(e, fieldSelectors.sponsored),
+}));
+"""
+
+
+def _extract_products(driver: WebDriver, selectors: dict[str, Any]) -> list[dict[str, Any]]:
+    """Extract all product fields from a search result page with a single execute_script call. Per-field find_attribute calls cost one WebDriver round-trip each; extracting in-browser collapses O(products x fields) round-trips into one.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+        selectors (dict[str, Any]): Resolved selectors config.
+
+    Returns:
+        list[dict[str, Any]]: Raw product fields per product element.
+    """
+
+    def as_list(value: str | list[str]) -> list[str]:
+        return [value] if isinstance(value, str) else list(value)
+
+    field_selectors: dict[str, list[str]] = {
+        "title": as_list(selectors["product_title"]),
+        "price": as_list(selectors["product_price"]),
+        "url": as_list(selectors["product_url"]),
+        "sponsored": as_list(selectors["sponsored"]),
+    }
+    return driver.execute_script(_EXTRACT_PRODUCTS_JS, selectors["products"], field_selectors) or []  # type: ignore[no-untyped-call]
+
+
 def get_products(driver: WebDriver, page: str, base_url: str, filename: str) -> list[dict[str, Any]]:
-    """Get products from a search result page.
+    """Get products from a search result page. All product fields are extracted in-browser with one JavaScript call instead of several WebDriver round-trips per product.
 
     Args:
         driver (WebDriver): A Selenium WebDriver instance.
@@ -86,40 +172,119 @@ def get_products(driver: WebDriver, page: str, base_url: str, filename: str) ->
     Returns:
         list[dict[str, Any]]: List of products found on the page. Each product is a dictionary with keys 'title', 'price', 'url', 'asin', 'simplified_url', and 'is_sponsored'.
     """
-    selectors: dict[str, Any] = ConfigValue("selectors").resolve()
+    selectors: dict[str, Any] = _selectors()
 
     driver.get(page)
     su.wait_page_ready(driver)
 
     save_webpage_as_png(driver, page, filename)
 
-    elements: list[WebElement] = driver.find_elements(By.CSS_SELECTOR, selectors["products"])
-
     products: list[dict[str, Any]] = []
-
-    for element in elements:
-        try:
-            product = {
-                "title": su.find_attribute(element, "product_title", "textContent"),
-                "price": su.find_attribute(element, "product_price", "innerText"),  # 'textContent'
-                "url": su.find_attribute(element, "product_url", "href"),
-                "asin": (asin := element.get_attribute("data-asin")),
-                "simplified_url": f"{base_url}/dp/{asin}",
-                "is_sponsored": bool(su.find_attribute(element, "sponsored", "innerText")),
-            }
-
-            products.append(product)
-        except NoSuchElementException as e:
-            logger.exception(f"Error processing product: {e}")
-            continue
+    try:
+        for row in _extract_products(driver, selectors):
+            products.append(
+                {
+                    "title": row.get("title"),
+                    "price": row.get("price"),
+                    "url": row.get("url"),
+                    "asin": (asin := row.get("asin")),
+                    "simplified_url": f"{base_url}/dp/{asin}",
+                    "is_sponsored": bool(row.get("is_sponsored")),
+                }
+            )
+    except WebDriverException as e:
+        logger.exception(f"Error processing product: {e}")
 
     logger.info(f"Processed {len(products)} products on page {page}")
 
     return products
 
 
+_CREATED_DIRS: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory (with parents) unless it was already created by this process. Avoids a stat syscall per output file in the save loops.
+
+    Args:
+        path (str): Directory path.
+    """
+    if path in _CREATED_DIRS:
+        return
+    Path(path).mkdir(parents=True, exist_ok=True)
+    _CREATED_DIRS.add(path)
+
+
+def discard_created_dirs(folder: str) -> None:
+    """Forget a folder and everything under it, so writes after its removal re-create the directories instead of trusting the stale dedup set.
+
+    Args:
+        folder (str): Folder whose subtree was (or is about to be) removed.
+    """
+    prefix: str = f"{folder}/"
+    for path in [p for p in _CREATED_DIRS if p == folder or p.startswith(prefix)]:
+        _CREATED_DIRS.discard(path)
+
+
+_NON_DIGIT_RE: re.Pattern[str] = re.compile(r"\D")
+_DEFAULT_STORE_CLEANUP: tuple[str, ...] = (r"^(?:Visit the |Brand: )", r"(?: Store| Brand)$")
+
+
+@functools.lru_cache(maxsize=4)
+def _store_clean_re_for(context: str, version: int) -> re.Pattern[str]:  # pylint: disable=unused-argument
+    """Compile the store-name cleanup pattern once per config-store state. The per-domain prefix/suffix phrases (e.g. "Visit the" on amazon.com, "Besuchen Sie den" on amazon.de) come from the selectors config; the English defaults apply when the key is absent.
+
+    Returns:
+        re.Pattern[str]: Compiled alternation of all cleanup patterns.
+    """
+    patterns: list[str] = _selectors().get("store_cleanup") or list(_DEFAULT_STORE_CLEANUP)
+    return re.compile("|".join(patterns))
+
+
+def _store_clean_re() -> re.Pattern[str]:
+    """Get the compiled store-name cleanup pattern, memoized until the config context changes."""
+    return _store_clean_re_for(ConfigStore.context, ConfigStore.version)
+
+
+# Amazon embeds the full high-res gallery as JSON in a P.register('ImageBlockATF', ...) script block.
+_COLOR_IMAGES_RE: re.Pattern[str] = re.compile(r"'colorImages':\s*\{\s*'initial':\s*")
+
+_JSON_DECODER: json.JSONDecoder = json.JSONDecoder()
+
+
+def _parse_gallery_json(page_source: str) -> list[str]:
+    """Parse the high-res gallery URLs embedded as JSON in the ImageBlockATF script block of an Amazon product page. The regex only locates the start of the array; the decoder itself finds where it ends, since the entries nest arrays that defeat any non-greedy match. Returns an empty list if the block is absent or not parseable.
+
+    Args:
+        page_source (str): HTML source of the product page.
+
+    Returns:
+        list[str]: List of image links (URLs).
+    """
+    match = _COLOR_IMAGES_RE.search(page_source)
+    if not match:
+        return []
+    try:
+        entries, _ = _JSON_DECODER.raw_decode(page_source, match.end())
+    except (json.JSONDecodeError, ValueError):
+        return []
+    if not isinstance(entries, list):
+        return []
+    urls = [entry.get("hiRes") or entry.get("large") for entry in entries if isinstance(entry, dict)]
+    return [url for url in urls if url and not url.endswith("gif")]
+
+
+_THUMBNAIL_URLS_JS = """
+return Array.from(document.querySelectorAll('#altImages li img'))
+    .map(img => img.closest('li').querySelector('[data-a-hires]')?.getAttribute('data-a-hires')
+        || img.getAttribute('data-old-hires')
+        || img.src)
+    .filter(url => url && !url.endsWith('.gif'));
+"""
+
+
 def get_image_urls(driver: WebDriver, url: str | None = None) -> Sequence[str | None]:
-    """Get image links from an Amazon product page.
+    """Get image links from an Amazon product page. The gallery JSON embedded in the page is parsed directly when present; hovering each thumbnail (with its per-thumbnail wait) is only used as fallback.
 
     Args:
         driver (WebDriver): A Selenium WebDriver instance.
@@ -130,9 +295,10 @@ def get_image_urls(driver: WebDriver, url: str | None = None) -> Sequence[str |
     """
     image_urls: list[str] = []
     try:
-        if url:
+        # The product page is often already loaded by the caller; only navigate
+        # (and pay another ready-wait) when the driver is somewhere else.
+        if url and driver.current_url != url:
             driver.get(url)
-            su.wait_page_ready(driver)
 
         if driver.current_url == "about:blank":
             raise ValueError("No URL provided")
@@ -142,6 +308,14 @@ def get_image_urls(driver: WebDriver, url: str | None = None) -> Sequence[str |
 
         su.wait_page_ready(driver)
 
+        if gallery_urls := _parse_gallery_json(driver.page_source):
+            return gallery_urls
+
+        # Second tier: the thumbnails themselves carry hi-res URLs in data-* attributes
+        # readable with one script call, with no hovering at all.
+        if thumbnail_urls := driver.execute_script(_THUMBNAIL_URLS_JS):  # type: ignore[no-untyped-call]
+            return thumbnail_urls
+
         elements = driver.find_elements(By.CSS_SELECTOR, "#altImages > ul > li")
         elements = [element for element in elements if element.size["height"] != 0]
 
@@ -149,8 +323,21 @@ def get_image_urls(driver: WebDriver, url: str | None = None) -> Sequence[str |
 
         for element in elements:
             driver.execute_script("arguments[0].scrollIntoView();", element)  # type: ignore[no-untyped-call]
+            previous_src: str | None = driver.find_element(By.CSS_SELECTOR, "#main-image-container img").get_attribute(
+                "src"
+            )
             actions.move_to_element(element).perform()
-            time.sleep(1)
+            try:
+                # Wait only until the hover handler has swapped the main image
+                # instead of a fixed one-second sleep per thumbnail.
+                WebDriverWait(driver, 2, poll_frequency=0.05).until(
+                    lambda d, src=previous_src: d.find_element(
+                        By.CSS_SELECTOR, "#main-image-container img"
+                    ).get_attribute("src")
+                    != src
+                )
+            except TimeoutException:
+                continue
 
         images = driver.find_element(By.CSS_SELECTOR, "#main-image-container").find_elements(By.TAG_NAME, "img")
         for image in images:
@@ -168,27 +355,251 @@ def get_image_urls(driver: WebDriver, url: str | None = None) -> Sequence[str |
     return image_urls
 
 
+_ETAG_CACHE_FILENAME: str = ".etag_cache.json"
+_ETAG_CACHE_LOCK: threading.Lock = threading.Lock()
+
+# One cache dict per directory, shared process-wide: concurrent batches touching the
+# same directory mutate the same dict instead of overwriting each other's entries.
+_ETAG_CACHES: dict[str, dict[str, Any]] = {}
+
+
+def _load_etag_cache(directory: str) -> dict[str, Any]:
+    """Load the sidecar cache of ETag/Last-Modified headers for previously downloaded images.
+
+    Args:
+        directory (str): Directory containing the cache file.
+
+    Returns:
+        dict[str, Any]: Mapping from image URL to (etag, last_modified) pairs.
+    """
+    try:
+        with open(f"{directory}/{_ETAG_CACHE_FILENAME}", "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _get_etag_cache(directory: str) -> dict[str, Any]:
+    """Get the shared ETag cache for a directory, loading it from disk on first use.
+
+    Args:
+        directory (str): Directory containing the cache file.
+
+    Returns:
+        dict[str, Any]: The shared mapping from image URL to (etag, last_modified) pairs.
+    """
+    with _ETAG_CACHE_LOCK:
+        cache = _ETAG_CACHES.get(directory)
+        if cache is None:
+            cache = _ETAG_CACHES[directory] = _load_etag_cache(directory)
+        return cache
+
+
+def _save_etag_cache(directory: str, cache: dict[str, Any]) -> None:
+    """Save the sidecar cache of ETag/Last-Modified headers. Serialization and the write happen under the cache lock so concurrent batches finishing together cannot interleave or drop each other's entries.
+
+    Args:
+        directory (str): Directory containing the cache file.
+        cache (dict[str, Any]): Mapping from image URL to (etag, last_modified) pairs.
+    """
+    with _ETAG_CACHE_LOCK:
+        payload: str = json.dumps(cache)
+        with open(f"{directory}/{_ETAG_CACHE_FILENAME}", "w", encoding="utf-8") as file:
+            file.write(payload)
+
+
+def _download_one(session: requests.Session, image_link: str, path: str, cache: dict[str, Any] | None = None) -> None:
+    """Download a single image to a file using a (shared) requests session. If the image was downloaded before, a conditional request is sent and a 304 response skips the body entirely.
+
+    Args:
+        session (requests.Session): A requests session.
+        image_link (str): Image link (URL).
+        path (str): Output file path.
+        cache (dict[str, Any] | None, optional): ETag/Last-Modified cache. Defaults to None.
+    """
+    try:
+        headers: dict[str, str] = {}
+        if cache is not None and Path(path).exists():
+            etag, last_modified = cache.get(image_link, (None, None))
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        response: requests.Response = session.get(image_link, timeout=5, stream=True, headers=headers)
+        if response.status_code == 304:
+            logger.debug(f"Image not modified, skipping download: {image_link}")
+            return
+        with open(path, "wb") as file:
+            shutil.copyfileobj(response.raw, file)
+        if cache is not None:
+            with _ETAG_CACHE_LOCK:
+                cache[image_link] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    except Exception as e:
+        logger.exception(f"Error saving image {image_link} to {path}: {e}")
+
+
+def _file_extension(url: str) -> str:
+    """Get the file extension from a URL without allocating a Path object. Any query string is stripped, which Path.suffix would mishandle.
+
+    Args:
+        url (str): URL.
+
+    Returns:
+        str: File extension without the leading dot, empty if the last path segment has none.
+    """
+    tail: str = url.rsplit("/", 1)[-1].split("?", 1)[0]
+    return tail.rsplit(".", 1)[-1] if "." in tail else ""
+
+
+def _save_images_batch(jobs: list[tuple[str, str, str]], max_workers: int = _MAX_DOWNLOAD_WORKERS) -> None:
+    """Download a batch of (url, filename, directory) jobs through one shared thread pool. Batching across directories keeps all downloads in flight together instead of draining one per-product pool at a time.
+
+    Args:
+        jobs (list[tuple[str, str, str]]): Tuples of image link (URL), filename without extension, and output directory.
+        max_workers (int, optional): Upper bound on concurrent downloads. Defaults to _MAX_DOWNLOAD_WORKERS.
+    """
+    if not jobs:
+        return
+    caches: dict[str, dict[str, Any]] = {}
+    tasks: list[tuple[str, str, dict[str, Any]]] = []
+    for image_link, filename, directory in jobs:
+        _ensure_dir(directory)
+        if directory not in caches:
+            caches[directory] = _get_etag_cache(directory)
+        extension: str = _file_extension(image_link)
+        path: str = f"{directory}/{filename}.{extension}" if extension else f"{directory}/{filename}"
+        tasks.append((image_link, path, caches[directory]))
+
+    with ThreadPoolExecutor(max_workers=min(max(1, max_workers), _MAX_DOWNLOAD_WORKERS, len(tasks))) as executor:
+        futures = [
+            executor.submit(_download_one, _SESSION, image_link, path, cache=cache) for image_link, path, cache in tasks
+        ]
+        for completed, future in enumerate(as_completed(futures), start=1):
+            future.result()
+            if completed % 25 == 0 or completed == len(futures):
+                logger.debug(f"Downloaded {completed} of {len(futures)} images")
+
+    for directory, cache in caches.items():
+        _save_etag_cache(directory, cache)
+
+
 def save_images(urls: list[str], filenames: list[str], directory: str) -> None:
-    """Save images from list of image links (URLs) to a directory using a list of filenames.
+    """Save images from list of image links (URLs) to a directory using a list of filenames. Images are downloaded concurrently through the shared pooled session.
 
     Args:
         urls (list[str]): List of image links (URLs).
         filenames (list[str]): List of filenames.
         directory (str): Output directory.
     """
-    Path(directory).mkdir(parents=True, exist_ok=True)
-    for _, (image_link, filename) in enumerate(zip(urls, filenames)):
-        try:
-            response: requests.Response = requests.get(image_link, timeout=5)
-            file_extension: str = Path(image_link).suffix[1:]
-            with open(f"{directory}/{filename}.{file_extension}", "wb") as file:
-                file.write(response.content)
-        except Exception as e:
-            logger.exception(f"Error saving image {image_link} to {directory}/{filename}: {e}")
+    _save_images_batch([(image_link, filename, directory) for image_link, filename in zip(urls, filenames)])
+
+
+_STATIC_HEADERS: dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+_STATIC_XPATHS: dict[str, str] = {
+    "title": '//span[@id="productTitle"]',
+    "price": (
+        '//*[@id="corePriceDisplay_desktop_feature_div"]//span[contains(@class, "aok-offscreen")]'
+        ' | //*[@id="corePrice_feature_div"]//span[contains(@class, "a-offscreen")]'
+    ),
+    "image": '//img[@id="landingImage"]',
+    "about": '//div[contains(@class, "a-spacing-medium")]//ul[contains(@class, "a-vertical")]',
+    "description": '//div[@id="productDescription"] | //*[@id="aplus_feature_div"]//*[@id="aplus"]/div',
+    "rating": '//*[@id="acrPopover"]//a/span',
+    "number_of_ratings": '//*[@id="acrCustomerReviewText"]',
+    "store": '//*[@id="bylineInfo"]',
+}
+
+
+def _fetch_product_html(session: requests.Session, url: str) -> Any:
+    """Fetch an Amazon product page over plain HTTP and parse it with lxml.
+
+    Args:
+        session (requests.Session): A requests session.
+        url (str): URL of the Amazon product page.
+
+    Returns:
+        Any: Parsed lxml document or None if the page could not be fetched.
+    """
+    response: requests.Response = session.get(url, timeout=10, headers=_STATIC_HEADERS)
+    if response.status_code != 200:
+        logger.debug(f"Static fetch of {url} returned status {response.status_code}")
+        return None
+    return lxml_html.fromstring(response.content)
+
+
+def _get_product_info_static(url: str) -> dict[str, Any]:
+    """Get product information from the server-rendered HTML of an Amazon product page. Most product fields (title, price, about, details, rating, store) are present in the initial HTML, so a plain HTTP fetch plus lxml parse avoids the cost of a full browser render. Returns an empty dict if the page could not be fetched or looks incomplete (e.g. a robot check page), in which case the caller should fall back to Selenium.
+
+    Args:
+        url (str): URL of the Amazon product page.
+
+    Returns:
+        dict[str, Any]: Product information or an empty dict.
+    """
+    if lxml_html is None:
+        return {}
+    try:
+        tree = _fetch_product_html(_SESSION, url)
+        if tree is None:
+            return {}
+
+        def first(key: str) -> Any:
+            elements = tree.xpath(_STATIC_XPATHS[key])
+            return elements[0] if elements else None
+
+        def first_text(key: str, default: str | None = "") -> str | None:
+            element = first(key)
+            return element.text_content().strip() if element is not None else default
+
+        title: str = first_text("title")
+        if not title:
+            return {}
+
+        image_element = first("image")
+        description_image_urls: list[str] = [
+            src
+            for element in tree.xpath(_STATIC_XPATHS["description"])
+            for src in element.xpath('.//img/@src')
+            if not src.endswith("gif")
+        ]
+
+        product_details: dict[str, str] = {
+            row.xpath('normalize-space(./th)'): row.xpath('normalize-space(./td)')
+            for row in tree.xpath('//div[@id="prodDetails"]//tr')
+            if row.xpath('./th') and row.xpath('./td')
+        }
+
+        number_of_ratings: str = _NON_DIGIT_RE.sub("", first_text("number_of_ratings"))
+
+        store: str = _store_clean_re().sub("", first_text("store")).strip()
+        store_element = first("store")
+
+        return {
+            "title_info": title,
+            "price_info": first_text("price", default=None),
+            "image_link": image_element.get("src") if image_element is not None else None,
+            "about": first_text("about"),
+            "product_description": first_text("description", default="IMAGE_DESCRIPTION_ONLY"),
+            "product_details": product_details,
+            "rating": first_text("rating"),
+            "number_of_ratings": number_of_ratings,
+            "store": store,
+            "store_url": store_element.get("href") if store_element is not None else None,
+            "description_image_urls": description_image_urls,
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+    except Exception as e:
+        logger.debug(f"Static product info extraction failed for {url}: {e}")
+        return {}
 
 
 def get_product_info(driver: WebDriver, url: str) -> dict[str, Any]:
-    """Get product information from an Amazon product page.
+    """Get product information from an Amazon product page. A plain HTTP fetch parsed with lxml is tried first since it skips browser rendering of ads and trackers; Selenium is used as fallback and for the image gallery which requires JavaScript.
 
     Args:
         driver (WebDriver): A Selenium WebDriver instance.
@@ -197,32 +608,55 @@ def get_product_info(driver: WebDriver, url: str) -> dict[str, Any]:
     Returns:
         dict[str, Any]: Product information.
     """
+    static_info: dict[str, Any] = _get_product_info_static(url)
+    if static_info:
+        static_info["image_urls"] = get_image_urls(driver, url)
+        return static_info
+
     for _ in range(3):
         try:
             driver.get(url)
 
             su.wait_page_ready(driver)
 
-            title = su.find_attribute(driver, "title", "innerText")
-            price = su.find_attribute(driver, "price", "innerText")
-            image_link = su.find_attribute(driver, "image", "src")
-            about = su.find_attribute(driver, "about", "innerText", default="").strip()
+            attributes = su.find_attributes(
+                driver,
+                {
+                    "title": ("title", "innerText"),
+                    "price": ("price", "innerText"),
+                    "image_link": ("image", "src"),
+                    "about": ("about", "innerText"),
+                    "product_description": ("description", "innerText"),
+                    "details": ("details", "innerText"),
+                    "rating": ("rating", "innerText"),
+                    "number_of_ratings": ("number_of_ratings", "innerText"),
+                    "store": ("store", "innerText"),
+                    "store_url": ("store", "href"),
+                },
+            )
+
+            title = attributes.get("title")
+            price = attributes.get("price")
+            image_link = attributes.get("image_link")
+            about = (attributes.get("about") or "").strip()
 
-            product_description = su.find_attribute(
-                driver, "description", "innerText", default="IMAGE_DESCRIPTION_ONLY"
+            product_description = attributes.get("product_description")
+            product_description = (
+                product_description if product_description is not None else "IMAGE_DESCRIPTION_ONLY"
             ).strip()
 
             # FIXME: Check if there are images in the product description
-            if su.find_element(driver, "description"):
+            description_element = su.find_element(driver, "description")
+            if description_element is not None:
                 description_image_urls = [
                     image.get_attribute("src")
-                    for image in su.find_element(driver, "description").find_elements(By.TAG_NAME, "img")  # type: ignore
+                    for image in description_element.find_elements(By.TAG_NAME, "img")
                     if not image.get_attribute("src").endswith("gif")  # type: ignore
                 ]
             else:
                 description_image_urls = []
 
-            details = su.find_attribute(driver, "details", "innerText", default="")
+            details = attributes.get("details") or ""
             product_details = {
                 key: value
                 for line in details.split("\n")
@@ -230,21 +664,12 @@ def get_product_info(driver: WebDriver, url: str) -> dict[str, Any]:
                 for key, value in [parts]
             }
 
-            rating = su.find_attribute(driver, "rating", "innerText", default="").strip()
-            number_of_ratings = su.find_attribute(driver, "number_of_ratings", "innerText", default="")
-            number_of_ratings = "".join([c for c in number_of_ratings if c.isdigit()])
-
-            store = su.find_attribute(driver, "store", "innerText", default="")
-            # FIXME: Fix for other domains (e.g. amazon.de, amazon.se). Add to config.
-            store = (
-                store.replace("Visit the ", "")
-                .replace("Brand: ", "")
-                .replace(" Store", "")
-                .replace(" Brand", "")
-                .strip()
-            )
+            rating = (attributes.get("rating") or "").strip()
+            number_of_ratings = _NON_DIGIT_RE.sub("", attributes.get("number_of_ratings") or "")
+
+            store = _store_clean_re().sub("", attributes.get("store") or "").strip()
 
-            store_url = su.find_attribute(driver, "store", "href")
+            store_url = attributes.get("store_url")
 
             image_urls = get_image_urls(driver)
 
@@ -286,26 +711,42 @@ def get_product_info_by_asin(driver: WebDriver | None = None, *, base_url: str,
         dict[str, Any]: Product information.
     """
     if driver is None:
-        driver = su.get_driver()
+        driver = su.get_shared_driver()
     url = f"{base_url}/dp/{asin}"
     return get_product_info(driver, url)
 
 
-def save_results(results: list[dict[str, Any]], directory: str, base_url: str, keyword: str) -> None:
-    """Save results to a CSV file.
+def _write_csv_rows(rows: Iterable[dict[str, Any]], file: Any) -> None:
+    """Stream rows of dicts to an open CSV file. The header is taken from the first row; rows are written one at a time with a positional writer so an arbitrarily large iterable is never buffered in memory.
 
     Args:
-        results (list[dict[str, Any]]): List of search results.
+        rows (Iterable[dict[str, Any]]): Rows to write.
+        file (Any): An open file object.
+    """
+    iterator = iter(rows)
+    first_row: dict[str, Any] | None = next(iterator, None)
+    if first_row is None:
+        return
+    fieldnames: list[str] = list(first_row.keys())
+    writer = csv.writer(file, delimiter=";")
+    writer.writerow(fieldnames)
+    writer.writerow([first_row.get(key) for key in fieldnames])
+    writer.writerows([row.get(key) for key in fieldnames] for row in iterator)
+
+
+def save_results(results: Iterable[dict[str, Any]], directory: str, base_url: str, keyword: str) -> None:
+    """Save results to a CSV file. Accepts any iterable of rows and streams them to disk.
+
+    Args:
+        results (Iterable[dict[str, Any]]): Search results.
         directory (str): Output directory.
         base_url (str): Base URL of the search engine.
         keyword (str): Search keyword.
     """
-    Path(directory).mkdir(parents=True, exist_ok=True)
+    _ensure_dir(directory)
     filename = f"{base_url.split('//')[-1].replace('/', '_')}_{keyword}.csv"
-    with open(f"{directory}/{filename}", "w", newline='', encoding="utf-8-sig") as file:
-        writer = csv.DictWriter(file, fieldnames=results[0].keys(), delimiter=";")
-        writer.writeheader()
-        writer.writerows(results)
+    with open(f"{directory}/{filename}", "w", newline='', encoding="utf-8-sig", buffering=1024 * 1024) as file:
+        _write_csv_rows(results, file)
 
 
 def save_webpage_as_png(driver: WebDriver | None, url: str, filename: str) -> None:
@@ -322,8 +763,12 @@ def save_webpage_as_png(driver: WebDriver | None, url: str, filename: str) -> No
     try:
 
         if driver is None:
-            driver = su.get_driver()
-        driver.get(url)
+            driver = su.get_shared_driver()
+
+        # Callers like get_products have already navigated to the page; re-issuing
+        # driver.get would double the page-load cost for the same URL.
+        if driver.current_url != url:
+            driver.get(url)
 
         WebDriverWait(driver, 30).until(
             lambda driver: driver.execute_script("return document.readyState") == "complete"  # type: ignore[no-untyped-call]
@@ -332,37 +777,60 @@ def save_webpage_as_png(driver: WebDriver | None, url: str, filename: str) -> No
         su.reject_cookies(driver)
         su.dismiss_popup(driver, "dismiss_delivery_options")
 
-        width = driver.execute_script(
-            "return Math.max( document.body.scrollWidth, document.body.offsetWidth, document.documentElement.clientWidth, document.documentElement.scrollWidth, document.documentElement.offsetWidth );"
-        )  # type: ignore[no-untyped-call]
+        _ensure_dir(str(Path(filename).parent))
 
-        height = driver.execute_script(
-            "return Math.max( document.body.scrollHeight, document.body.offsetHeight, document.documentElement.clientHeight, document.documentElement.scrollHeight, document.documentElement.offsetHeight );"
-        )  # type: ignore[no-untyped-call]
+        if hasattr(driver, "get_full_page_screenshot_as_file"):
+            driver.get_full_page_screenshot_as_file(filename)
+        else:
+            # Fallback for drivers without native full-page screenshots: resize the window to the document size.
+            width = driver.execute_script(
+                "return Math.max( document.body.scrollWidth, document.body.offsetWidth, document.documentElement.clientWidth, document.documentElement.scrollWidth, document.documentElement.offsetWidth );"
+            )  # type: ignore[no-untyped-call]
 
-        driver.set_window_size(width, height)
+            height = driver.execute_script(
+                "return Math.max( document.body.scrollHeight, document.body.offsetHeight, document.documentElement.clientHeight, document.documentElement.scrollHeight, document.documentElement.offsetHeight );"
+            )  # type: ignore[no-untyped-call]
 
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
-        driver.save_screenshot(filename)
+            driver.set_window_size(width, height)
+            driver.save_screenshot(filename)
     except Exception as e:
         logger.exception(f"Error saving webpage {url} as PNG: {e}")
 
 
-def save_full_page_screenshots(output_directory: str, results: list[dict[str, Any]]) -> None:
-    """Save full page screenshots of search results to a directory.
+def save_full_page_screenshots(output_directory: str, results: list[dict[str, Any]], max_workers: int = 4) -> None:
+    """Save full page screenshots of search results to a directory. Screenshots are taken concurrently, each worker thread using its own WebDriver instance since a single driver is not thread-safe.
 
     Args:
         output_directory (str): Output directory.
         results (list[dict[str, Any]]): List of search results.
+        max_workers (int, optional): Maximum number of concurrent drivers. Defaults to 4.
     """
+    if not results:
+        return
+
+    thread_local = threading.local()
+    drivers: list[WebDriver] = []
+    drivers_lock = threading.Lock()
+
+    def thread_driver() -> WebDriver:
+        if not hasattr(thread_local, "driver"):
+            thread_local.driver = su.get_driver()
+            with drivers_lock:
+                drivers.append(thread_local.driver)
+        return thread_local.driver
+
+    def screenshot_task(result: dict[str, Any]) -> None:
+        target_filename: str = f"{output_directory}/{result['sort_id']}/{result['sort_id']}_full_page.png"
+        save_webpage_as_png(thread_driver(), result["url"], target_filename)
+
     try:
-        driver: WebDriver = su.get_driver()
-        for result in results:
-            target_filename: str = f"{output_directory}/{result['sort_id']}/{result['sort_id']}_full_page.png"
-            save_webpage_as_png(driver, result["url"], target_filename)
-        driver.quit()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(results))) as executor:
+            list(executor.map(screenshot_task, results))
     except Exception as e:
         logger.exception(f"Error saving full page screenshots: {e}")
+    finally:
+        for driver in drivers:
+            driver.quit()
 
 
 def search_amazon(
@@ -371,6 +839,8 @@ def search_amazon(
     max_results: int | None = None,
     max_search_result_pages: int | None = None,
     output_directory: str | None = None,
+    *,
+    max_workers: int = 1,
 ) -> list[dict[str, Any]]:
     """Search Amazon for a keyword and get product information. Optionally, if an output directory is provided, save search result pages as PNG files.
 
@@ -380,6 +850,7 @@ def search_amazon(
         max_results (int | None, optional): Maximum number of results. Defaults to None.
         max_search_result_pages (int | None, optional): Maximum number of search result pages. Defaults to None.
         output_directory (str | None, optional): Output directory. If provided, save search result pages as PNG files. Defaults to None.
+        max_workers (int, optional): Number of concurrent drivers for product detail fetching. Defaults to 1.
 
     Returns:
         list[dict[str, Any]]: List of search results.
@@ -396,7 +867,7 @@ def search_amazon(
             driver, base_url, max_results, pages, output_directory
         )
 
-        products = get_product_informations(driver, base_url, keyword, candidates)
+        products = get_product_informations(driver, base_url, keyword, candidates, max_workers=max_workers)
 
     except NoSuchElementException as e:
         logger.exception(f"Error searching for {keyword}: {e}")
@@ -424,29 +895,78 @@ def store_search_result_images(driver: WebDriver, output_directory: str | None,
         save_webpage_as_png(driver, page, f"{output_directory}/search_page_{str(index).zfill(2)}.png")
 
 
+def _fetch_product_infos(candidates: list[dict[str, Any]], max_workers: int) -> list[dict[str, Any]]:
+    """Fetch product information for a list of candidates concurrently using a pool of dedicated drivers. Product detail fetching is network/render-bound, so a handful of drivers working side by side gives a near-linear speedup of this phase.
+
+    Args:
+        candidates (list[dict[str, Any]]): List of search results.
+        max_workers (int): Number of drivers in the pool.
+
+    Returns:
+        list[dict[str, Any]]: Product information per candidate, in candidate order. Failed fetches yield empty dicts.
+    """
+    pool_size: int = min(max_workers, len(candidates))
+    drivers: queue.Queue[WebDriver] = queue.Queue()
+    for _ in range(pool_size):
+        drivers.put(su.get_driver())
+
+    def fetch_one(candidate: dict[str, Any]) -> dict[str, Any]:
+        pooled_driver: WebDriver = drivers.get()
+        try:
+            return get_product_info(pooled_driver, candidate["url"])
+        except Exception as e:
+            logger.exception(f"Error processing product {candidate['url']}: {e}")
+            return {}
+        finally:
+            drivers.put(pooled_driver)
+
+    try:
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            return list(executor.map(fetch_one, candidates))
+    finally:
+        while not drivers.empty():
+            drivers.get_nowait().quit()
+
+
 def get_product_informations(
-    driver: WebDriver, base_url: str, keyword: str, candidates: list[dict[str, Any]]
+    driver: WebDriver, base_url: str, keyword: str, candidates: list[dict[str, Any]], max_workers: int = 1
 ) -> list[dict[str, Any]]:
-    """Get product information from a list of search results.
+    """Get product information from a list of search results. With max_workers > 1, the per-product pages are fetched concurrently by a pool of dedicated drivers; sort ids are assigned sequentially afterwards so the ordering is identical either way.
 
     Args:
         driver (WebDriver): A Selenium WebDriver instance.
         base_url (str): Base URL of the search engine.
         keyword (str): The search keyword.
         candidates (list[dict[str, Any]]): List of search results.
+        max_workers (int, optional): Number of concurrent drivers for detail fetching. Defaults to 1.
 
     Returns:
         list[dict[str, Any]]: List of search results with product information.
     """
 
     def get_image_names(urls: list[str], sort_id: str) -> list[str]:
-        return [f"{sort_id}{chr(97+index)}.{url.split('.')[-1]}" for index, url in enumerate(urls)]
+        return [
+            (
+                f"{sort_id}{chr(97+index)}.{extension}"
+                if (extension := _file_extension(url))
+                else f"{sort_id}{chr(97+index)}"
+            )
+            for index, url in enumerate(urls)
+        ]
+
+    tld: str = urlparse(base_url).netloc.rsplit('.', 1)[-1]
+
+    product_infos: list[dict[str, Any]] | None = (
+        _fetch_product_infos(candidates, max_workers) if max_workers > 1 and len(candidates) > 1 else None
+    )
 
     sort_id = 1
     products: list[dict[str, Any]] = []
-    for candidate in candidates:
+    for index, candidate in enumerate(candidates):
         try:
-            product_info: dict[str, Any] = get_product_info(driver, candidate["url"])
+            product_info: dict[str, Any] = (
+                product_infos[index] if product_infos is not None else get_product_info(driver, candidate["url"])
+            )
 
             if not product_info:
                 continue
@@ -455,7 +975,7 @@ def get_product_informations(
             candidate.update(
                 product_info
                 | {
-                    "tld": urlparse(base_url).netloc.split('.')[-1],
+                    "tld": tld,
                     "keyword": keyword,
                     "sort_id": sort_id_str,
                     "image_names": get_image_names(product_info.get("image_urls", []), sort_id_str),
@@ -506,43 +1026,128 @@ def get_products_found_on_pages(
     return candidates
 
 
-def save_images_from_results(results: list[dict[str, Any]], directory: str, subdir_key: str) -> None:
+def save_images_from_results(
+    results: list[dict[str, Any]], directory: str, subdir_key: str, max_workers: int = _MAX_DOWNLOAD_WORKERS
+) -> None:
     """Save images from a list of search results to a directory. The subdirectory is created using a key from the results.
 
     Args:
         results (list[dict[str, Any]]): List of search results.
         directory (str): Output directory.
         subdir_key (str): Key to use as subdirectory.
+        max_workers (int, optional): Upper bound on concurrent downloads. Defaults to _MAX_DOWNLOAD_WORKERS.
     """
+    jobs: list[tuple[str, str, str]] = []
     for result in results:
         subdirectory = result[subdir_key]
         result_directory: str = f"{directory}/{subdirectory}"
-        save_images(result["image_urls"], result["image_names"], result_directory)
+        jobs += [
+            (image_link, filename, result_directory)
+            for image_link, filename in zip(result["image_urls"], result["image_names"])
+        ]
+    _save_images_batch(jobs, max_workers=max_workers)
 
 
-def save_description_images(results: list[dict[str, Any]], directory: str, subdir_key: str) -> None:
+def save_description_images(
+    results: list[dict[str, Any]], directory: str, subdir_key: str, max_workers: int = _MAX_DOWNLOAD_WORKERS
+) -> None:
     """Save description images from a list of search results to a directory. The subdirectory is created using a key from the results.
 
     Args:
         results (list[dict[str, Any]]): List of search results.
         directory (str): Output directory.
         subdir_key (str): Key to use as subdirectory.
+        max_workers (int, optional): Upper bound on concurrent downloads. Defaults to _MAX_DOWNLOAD_WORKERS.
     """
+    jobs: list[tuple[str, str, str]] = []
     for result in results:
         try:
             subdirectory: str = result[subdir_key]
             if description_image_urls := result.get("description_image_urls"):
-                description_image_names: list[str] = [
-                    f"{result['sort_id']}_product_image_{str(i+1).zfill(2)}" for i in range(len(description_image_urls))
+                jobs += [
+                    (
+                        image_link,
+                        f"{result['sort_id']}_product_image_{str(i+1).zfill(2)}",
+                        f"{directory}/{subdirectory}",
+                    )
+                    for i, image_link in enumerate(description_image_urls)
                 ]
-                save_images(description_image_urls, description_image_names, f"{directory}/{subdirectory}")
         except Exception as e:
             logger.exception(f"Error saving description images: {e}")
             continue
+    _save_images_batch(jobs, max_workers=max_workers)
+
+
+def _navigate_same_origin(driver: WebDriver, url: str) -> None:
+    """Navigate to a URL. For same-host hops (e.g. review pages of consecutive ASINs) an in-page JavaScript redirect keeps the renderer process warm and skips part of the navigation setup that a full driver.get pays; cross-host navigations fall back to driver.get.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+        url (str): Target URL.
+    """
+    previous_url: str = driver.current_url
+    if previous_url != url and urlparse(previous_url).netloc == urlparse(url).netloc:
+        driver.execute_script("window.location.href = arguments[0];", url)  # type: ignore[no-untyped-call]
+        try:
+            # Amazon 301-redirects review URLs to a slugged canonical form, so the final
+            # URL is not a prefix match on `url`; any change away from the pre-redirect
+            # URL means the navigation took.
+            WebDriverWait(driver, 3, poll_frequency=0.1).until(lambda d: d.current_url != previous_url)
+        except TimeoutException:
+            # The redirect stalled and the old page is still loaded; a plain get
+            # guarantees the caller really is on the target URL before scraping.
+            logger.debug(f"In-page navigation to {url} timed out, falling back to driver.get")
+            driver.get(url)
+    else:
+        driver.get(url)
 
 
 PossibleSentiments = Literal["1_star", "2_star", "3_star", "4_star", "5_star", "positive", "critical", "all"]
 
+_EXTRACT_REVIEWS_JS: str = """
+const [reviewsSelector, fieldSelectors] = arguments;
+const first = (root, sels) => {
+    for (const s of sels) {
+        const e = root.querySelector(s);
+        if (e) return e;
+    }
+    return null;
+};
+return Array.from(document.querySelectorAll(reviewsSelector)).map(e => ({
+    author: first(e, fieldSelectors.author)?.textContent ?? null,
+    rating: first(e, fieldSelectors.rating)?.innerHTML ?? null,
+    title: first(e, fieldSelectors.title)?.innerText?.trim() ?? '',
+    location_and_date: first(e, fieldSelectors.date)?.textContent ?? null,
+    verified: first(e, fieldSelectors.verified)?.textContent ?? null,
+    text: first(e, fieldSelectors.text)?.innerText ?? null,
+}));
+"""
+
+
+def _extract_reviews(driver: WebDriver, selectors: dict[str, Any]) -> list[dict[str, Any]]:
+    """Extract all review fields from a review page with a single execute_script call, avoiding several WebDriver round-trips per review.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+        selectors (dict[str, Any]): Resolved selectors config.
+
+    Returns:
+        list[dict[str, Any]]: Raw review fields per review element.
+    """
+
+    def as_list(value: str | list[str]) -> list[str]:
+        return [value] if isinstance(value, str) else list(value)
+
+    field_selectors: dict[str, list[str]] = {
+        "author": as_list(selectors["review_author"]),
+        "rating": as_list(selectors["review_rating"]),
+        "title": as_list(selectors["review_title"]),
+        "date": as_list(selectors["review_date"]),
+        "verified": as_list(selectors["review_verified"]),
+        "text": as_list(selectors["review_text"]),
+    }
+    return driver.execute_script(_EXTRACT_REVIEWS_JS, selectors["review_elements"], field_selectors) or []  # type: ignore[no-untyped-call]
+
 
 def get_reviews(
     driver: WebDriver,
@@ -564,31 +1169,31 @@ def get_reviews(
     Returns:
         list[dict] | None: List of reviews or None.
     """
-    selectors: dict[str, Any] = ConfigValue("selectors").resolve()
+    selectors: dict[str, Any] = _selectors()
 
     url: str = f"{base_url}/product-reviews/{asin}"
-    driver.get(url)
+    _navigate_same_origin(driver, url)
 
     su.wait_page_ready(driver)
     su.reject_cookies(driver)
     su.dismiss_popup(driver, "dismiss_delivery_options")
 
-    reviews = []
-
-    # TODO: Add function get_element_with_attribute_value
-    reviews_button: WebElement | None = None
-    try:
-        for selector in selectors.get("reviews_stars_button", []):
-            if driver.find_element(By.CSS_SELECTOR, selector).get_attribute("textContent") == "All stars":
-                reviews_button = driver.find_element(By.CSS_SELECTOR, selector)
-                break
-    except NoSuchElementException:
+    # One XPath query matches any candidate button by its text; find_elements raises no
+    # exception on a miss, and a miss on the first selector no longer ends the search.
+    reviews_button: WebElement | None = next(
+        iter(
+            driver.find_elements(
+                By.XPATH, '//a[normalize-space()="All stars"] | //button[normalize-space()="All stars"]'
+            )
+        ),
+        None,
+    )
+    if reviews_button is None:
         logger.warning(f"Reviews button not found for ASIN: {asin}")
         return None
 
     # NOTE: Better to use?: ActionChains(driver).move_to_element(reviews_button).click().perform()
-    if reviews_button is not None:
-        reviews_button.click()
+    reviews_button.click()
 
     sentiment_dropdown = su.find_element(driver, f"{sentiment}_reviews")
     if sentiment_dropdown is None:
@@ -597,36 +1202,31 @@ def get_reviews(
 
     sentiment_dropdown.click()
 
-    driver.refresh()  # NOTE: Prevents stale element exception
-
-    elements = driver.find_elements(By.CSS_SELECTOR, selectors["review_elements"])
-    for element in elements:
-        review = {
-            "asin": asin,
-            "author": su.find_attribute(element, "review_author", "textContent"),
-            "rating": su.find_attribute(element, "review_rating", "innerHTML"),
-            "title": su.find_element(element, "review_title").text if su.find_element(element, "review_title") is not None else "",  # type: ignore
-            "location_and_date": su.find_attribute(element, "review_date", "textContent"),
-            "verified": su.find_attribute(element, "review_verified", "textContent"),
-            "text": su.find_attribute(element, "review_text", "innerText"),
-        }
-        reviews.append(review)
+    # Wait for the filtered review list to render instead of forcing a full page
+    # reload; extraction runs in-browser, so stale element references are not a risk.
+    review_selector: str | list[str] = selectors.get("review_elements", "")
+    if isinstance(review_selector, list):
+        review_selector = ", ".join(review_selector)
+    try:
+        WebDriverWait(driver, 10, poll_frequency=0.2).until(lambda d: d.find_elements(By.CSS_SELECTOR, review_selector))
+    except TimeoutException:
+        logger.debug(f"No review elements appeared for ASIN: {asin} and sentiment: {sentiment}")
+
+    reviews = [{"asin": asin, **row} for row in _extract_reviews(driver, selectors)]
 
     return reviews
 
 
-def save_reviews(reviews: list[dict[str, Any]], filename: str) -> None:
-    """Save reviews to a CSV file.
+def save_reviews(reviews: Iterable[dict[str, Any]], filename: str) -> None:
+    """Save reviews to a CSV file. Accepts any iterable of rows and streams them to disk.
 
     Args:
-        reviews (list[dict[str, Any]]): List of reviews.
+        reviews (Iterable[dict[str, Any]]): Reviews.
         filename (str): Output filename.
     """
-    Path(filename).parent.mkdir(parents=True, exist_ok=True)
-    with open(filename, "w", newline="", encoding="utf-8") as file:
-        writer = csv.DictWriter(file, fieldnames=reviews[0].keys(), delimiter=";")
-        writer.writeheader()
-        writer.writerows(reviews)
+    _ensure_dir(str(Path(filename).parent))
+    with open(filename, "w", newline="", encoding="utf-8", buffering=1024 * 1024) as file:
+        _write_csv_rows(reviews, file)
 
 
 # FIXME: Add `base_url` to arguments. Change `results` to list of ASINs and sort_ids.
@@ -652,7 +1252,8 @@ def export_reviews(
     if not all(key in results[0] for key in ["asin", "sort_id"]):
         raise ValueError("Results do not contain 'asin' and 'sort_id' keys")
 
-    driver: WebDriver = su.get_driver()
+    # Reviews are text-only, so skip downloading images and fonts.
+    driver: WebDriver = su.get_driver(block_media=True)
     try:
         for result in results:
             asin = result["asin"]
@@ -665,7 +1266,7 @@ def export_reviews(
                 logger.info(f"No {sentiment} reviews found for {sort_id}. ASIN: {asin}.")
                 if create_empty_files:
                     logger.info(f"Creating empty file: {filename}")
-                    Path(filename).parent.mkdir(parents=True, exist_ok=True)
+                    _ensure_dir(str(Path(filename).parent))
                     with open(filename, "w", newline="", encoding="utf-8") as file:
                         file.write('')
                 continue
@@ -74,6 +74,7 @@ class Config:
             data = data.items()
         for key, value in data:
             dotset(self.data, key, value)
+        self._invalidate_resolutions()
 
     def exists(self, *keys) -> bool:
         return dotexists(self.data, *keys)
@@ -116,3 +117,11 @@ class Config:
     def add(self, data: dict) -> None:
         """Recursively add data to the configuration."""
         self.data.update(data)
+        self._invalidate_resolutions()
+
+    @staticmethod
+    def _invalidate_resolutions() -> None:
+        """Bump the store version so memoized ConfigValue resolutions of the old data are discarded."""
+        from .inject import ConfigStore  # pylint: disable=import-outside-toplevel, cyclic-import
+
+        ConfigStore.version += 1
@@ -36,6 +36,8 @@ class ConfigValue(Generic[T]):
     description: str | None = None
     after: Callable[[T], T] | None = None
     mandatory: bool = False
+    _cached: T | None = field(default=None, init=False, repr=False, compare=False)
+    _cached_token: tuple[str, int] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def value(self) -> T:
@@ -43,18 +45,25 @@ class ConfigValue(Generic[T]):
         return self.resolve()
 
     def resolve(self) -> T:
-        """Resolve the value from the current store (configuration file)"""
+        """Resolve the value from the current store (configuration file). Resolutions are memoized per instance and invalidated when the store's context or config changes, so hot-path lookups skip the dotpath walk."""
         if isinstance(self.key, Config):
             return ConfigStore.config()  # type: ignore
         if isclass(self.key):
             return self.key()
+
+        token: tuple[str, int] = (ConfigStore.context, ConfigStore.version)
+        if self._cached_token == token:
+            return self._cached
+
         if self.mandatory and not self.default:
             if not ConfigStore.config().exists(self.key):
                 raise ValueError(f"ConfigValue {self.key} is mandatory but missing from config")
 
         value = ConfigStore.config().get(*self.key.split(","), default=self.default)
         if value and self.after:
-            return self.after(value)
+            value = self.after(value)
+        self._cached = value
+        self._cached_token = token
         return value
 
     @staticmethod
@@ -70,6 +79,9 @@ class ConfigStore:
 
     store: dict[str, str | Config] = {"default": None}
     context: str = "default"
+    # Bumped whenever a context's config object is (re)set; lets ConfigValue instances
+    # detect that their memoized resolution is stale with a single int comparison.
+    version: int = 0
 
     @classmethod
     def config(cls) -> "Config":
@@ -159,6 +171,7 @@ class ConfigStore:
         cfg.context = context
         cls.store[context] = cfg
         cls.context = context
+        cls.version += 1
         return cls.store[context]
 
 
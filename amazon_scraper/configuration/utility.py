@@ -1,6 +1,7 @@
 # type: ignore
 from __future__ import annotations
 
+import functools
 import os
 from typing import Any
 
@@ -12,7 +13,14 @@ class dotdict(dict):
 
     def __getattr__(self, *args):
         value = self.get(*args)
-        return dotdict(value) if isinstance(value, dict) else value
+        if isinstance(value, dotdict) or not isinstance(value, dict):
+            return value
+        # Convert a nested plain dict once and store it back, so chained accesses
+        # like cfg.a.b.c do not re-allocate a wrapper on every step.
+        value = dotdict(value)
+        if len(args) == 1:
+            self[args[0]] = value
+        return value
 
     __setattr__ = dict.__setitem__
     __delattr__ = dict.__delitem__
@@ -28,20 +36,16 @@ def dget(data: dict, *path: str | list[str], default: Any = None) -> Any:
     Returns:
         Any: Element from dict or default value.
     """
-    if path is None or not data:
+    if not path or not data:
         return default
 
-    ps: list[str] = path if isinstance(path, (list, tuple)) else [path]
-
-    d = None
-
-    for p in ps:
+    for p in path:
         d = dotget(data, p)
 
         if d is not None:
             return d
 
-    return d or default
+    return default
 
 
 def dotexists(data: dict, *paths: list[str]) -> bool:
@@ -59,14 +63,15 @@ def dotexists(data: dict, *paths: list[str]) -> bool:
     return False
 
 
-def dotexpand(path: str) -> list[str]:
-    """Expand dot notation path into list of paths. Expands paths with ',' and ':'.
+@functools.lru_cache(maxsize=1024)
+def _dotexpand(path: str) -> tuple[str, ...]:
+    """Expand dot notation path into a tuple of paths, cached per distinct path string.
 
     Args:
         path (str): Path to expand.
 
     Returns:
-        list[str]: List of expanded paths.
+        tuple[str, ...]: Tuple of expanded paths.
     """
     paths = []
     for p in path.replace(' ', '').split(','):
@@ -76,7 +81,32 @@ def dotexpand(path: str) -> list[str]:
             paths.extend([p.replace(":", "."), p.replace(":", "_")])
         else:
             paths.append(p)
-    return paths
+    return tuple(paths)
+
+
+@functools.lru_cache(maxsize=1024)
+def _dotsplit(path: str) -> tuple[tuple[str, ...], ...]:
+    """Expand and split a dot notation path into attribute tuples, cached per distinct path string. Lookups become a tight tuple-walk with no per-call string churn.
+
+    Args:
+        path (str): Path to expand and split.
+
+    Returns:
+        tuple[tuple[str, ...], ...]: One tuple of attributes per expanded path.
+    """
+    return tuple(tuple(key.split('.')) for key in _dotexpand(path))
+
+
+def dotexpand(path: str) -> list[str]:
+    """Expand dot notation path into list of paths. Expands paths with ',' and ':'.
+
+    Args:
+        path (str): Path to expand.
+
+    Returns:
+        list[str]: List of expanded paths.
+    """
+    return list(_dotexpand(path))
 
 
 def dotget(data: dict, path: str, default: Any = None) -> Any:
@@ -93,9 +123,9 @@ def dotget(data: dict, path: str, default: Any = None) -> Any:
         Any: The element from the dictionary or the default value.
     """
 
-    for key in dotexpand(path):
+    for attrs in _dotsplit(path):
         d: dict = data
-        for attr in key.split('.'):
+        for attr in attrs:
             d: dict = d.get(attr) if isinstance(d, dict) else None
             if d is None:
                 break
@@ -124,9 +154,13 @@ def env2dict(prefix: str, data: dict[str, str] | None = None, lower_key: bool =
         data = {}
     if not prefix:
         return data
-    for key, value in os.environ.items():
-        if lower_key:
-            key = key.lower()
-        if key.startswith(prefix.lower()):
-            dotset(data, key[len(prefix) + 1 :], value)
+    prefix_l: str = prefix.lower()
+    plen: int = len(prefix) + 1
+    matches = [
+        (key, value)
+        for key, value in ((key.lower() if lower_key else key, value) for key, value in os.environ.items())
+        if key.startswith(prefix_l)
+    ]
+    for key, value in matches:
+        dotset(data, key[plen:], value)
     return data
@@ -1,5 +1,7 @@
-import time
-from typing import Any
+import atexit
+import functools
+import weakref
+from typing import Any, NamedTuple
 
 from loguru import logger
 from selenium import webdriver
@@ -9,37 +11,147 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
 
-from amazon_scraper.configuration import ConfigValue  # type: ignore
+from amazon_scraper.configuration import ConfigStore, ConfigValue  # type: ignore
 
 
-def get_driver() -> WebDriver:
+@functools.lru_cache(maxsize=4)
+def _get_selectors_for(context: str, version: int) -> dict[str, Any]:  # pylint: disable=unused-argument
+    """Resolve the selectors config once per config-store state.
+
+    Selector lookups happen dozens of times per product; memoizing avoids walking the
+    config tree on every element access. The arguments only key the cache, so a
+    configure_context call invalidates it the same way ConfigValue.resolve does.
+
+    Returns:
+        dict[str, Any]: Selectors keyed by name.
+    """
+    return ConfigValue("selectors").resolve() or {}
+
+
+def _get_selectors() -> dict[str, Any]:
+    """Resolve the selectors config, memoized until the config context changes.
+
+    Returns:
+        dict[str, Any]: Selectors keyed by name.
+    """
+    return _get_selectors_for(ConfigStore.context, ConfigStore.version)
+
+
+class _CompiledSelector(NamedTuple):
+    """Precompiled form of one selectors.yaml entry."""
+
+    pairs: tuple[tuple[str, str], ...]
+    """All selectors as (By, selector) tuples, XPath detected by a leading '/' or '('."""
+    joined: str
+    """Comma-joined CSS selectors for single-query matching; empty if none are CSS."""
+
+
+@functools.lru_cache(maxsize=4)
+def _compiled_selectors_for(  # pylint: disable=unused-argument
+    context: str, version: int
+) -> dict[str, _CompiledSelector]:
+    """Normalize the selectors config once per config-store state.
+
+    Each entry is typed per selector (CSS vs XPath, detected by shape) and the CSS
+    subset is pre-joined, so lookups get single-query CSS plus XPath fallbacks without
+    re-normalizing string-vs-list entries per call. The arguments only key the cache,
+    invalidating it when configure_context runs again.
+
+    Returns:
+        dict[str, _CompiledSelector]: Key to compiled selector entry.
+    """
+    compiled: dict[str, _CompiledSelector] = {}
+    for key, config in _get_selectors().items():
+        selectors: list[str] = [config] if isinstance(config, str) else list(config)
+        pairs: tuple[tuple[str, str], ...] = tuple(
+            (By.XPATH if selector.startswith(('/', '(')) else By.CSS_SELECTOR, selector) for selector in selectors
+        )
+        joined: str = ", ".join(selector for by, selector in pairs if by == By.CSS_SELECTOR)
+        compiled[key] = _CompiledSelector(pairs, joined)
+    return compiled
+
+
+def _compiled_selectors() -> dict[str, _CompiledSelector]:
+    """Get the compiled selectors, memoized until the config context changes.
+
+    Returns:
+        dict[str, _CompiledSelector]: Key to compiled selector entry.
+    """
+    return _compiled_selectors_for(ConfigStore.context, ConfigStore.version)
+
+
+def get_driver(block_media: bool = False) -> WebDriver:
     """Get a headless Firefox WebDriver instance.
 
+    Args:
+        block_media (bool, optional): Block images and downloadable fonts. Cuts page weight considerably for flows that only read the DOM, but must stay off for flows that take screenshots. Defaults to False.
+
     Returns:
         WebDriver: A headless Firefox WebDriver instance.
     """
     options = webdriver.FirefoxOptions()
     options.add_argument('-headless')
+    # Return from driver.get as soon as the DOM is interactive instead of waiting
+    # for every subresource (ads, trackers); wait_page_ready handles the rest.
+    options.page_load_strategy = "eager"
+    # More parallel connections per host and an on-disk HTTP cache help both the
+    # many-assets product pages and repeat visits within a run.
+    options.set_preference("network.http.max-persistent-connections-per-server", 10)
+    options.set_preference("browser.cache.disk.enable", True)
+    if block_media:
+        options.set_preference("permissions.default.image", 2)
+        options.set_preference("gfx.downloadable_fonts.enabled", False)
     driver = webdriver.Firefox(options=options)
+    # Reuse one connection to geckodriver across WebDriver commands instead of paying
+    # connection setup per find_element/execute_script call.
+    driver.command_executor.keep_alive = True
+    return driver
+
+
+@functools.cache
+def get_shared_driver() -> WebDriver:
+    """Get a lazily created, process-wide WebDriver instance. Launching Firefox costs seconds; callers that are invoked in a loop without their own driver reuse this one instead of spawning a fresh browser per call. The driver is quit at interpreter exit.
+
+    Returns:
+        WebDriver: The shared headless Firefox WebDriver instance.
+    """
+    driver = get_driver()
+    atexit.register(driver.quit)
     return driver
 
 
-def find_webdriver_parent(item: WebDriver | WebElement, depth: int = 0) -> WebDriver | None:
-    """Find the parent webdriver object. This function is recursive. The depth parameter is used to prevent infinite recursion.
+# Element-to-driver resolutions are cached weakly so repeated readiness checks on the
+# same element skip the parent-chain walk without keeping elements alive.
+_PARENT_CACHE: "weakref.WeakKeyDictionary[WebElement, WebDriver]" = weakref.WeakKeyDictionary()
+
+
+def find_webdriver_parent(item: WebDriver | WebElement) -> WebDriver | None:
+    """Find the parent webdriver object by walking the parent chain (bounded at 10 levels). Resolutions for elements are memoized per element.
 
     Args:
         item (WebDriver | WebElement): Webdriver object.
-        depth (int, optional): Recursion depth. Defaults to 0.
 
     Returns:
         WebDriver | None: Parent webdriver object. None if not found.
     """
-    if depth > 10:  # FIXME: Handle infinite recursion better
-        return None
     if isinstance(item, WebDriver):
         return item
-    if hasattr(item, 'parent'):
-        return find_webdriver_parent(item.parent, depth + 1)
+    try:
+        if (cached := _PARENT_CACHE.get(item)) is not None:
+            return cached
+    except TypeError:
+        pass
+    current: Any = item
+    for _ in range(10):
+        current = getattr(current, 'parent', None)
+        if current is None:
+            return None
+        if isinstance(current, WebDriver):
+            try:
+                _PARENT_CACHE[item] = current
+            except TypeError:
+                pass
+            return current
     return None
 
 
@@ -58,6 +170,10 @@ def wait_page_ready(item: WebDriver | WebElement) -> None:
     parent = find_webdriver_parent(item)
     if parent is None:
         raise ValueError("Parent webdriver object not found")
+    # Fast path: on already-loaded pages a single readyState probe avoids building
+    # a WebDriverWait and its polling machinery.
+    if parent.execute_script("return document.readyState") == "complete":  # type: ignore[no-untyped-call]
+        return
     try:
         WebDriverWait(parent, 30).until(
             lambda driver: isinstance(driver, WebDriver)
@@ -67,33 +183,33 @@ def wait_page_ready(item: WebDriver | WebElement) -> None:
         raise TimeoutError("Page not loaded") from e
 
 
-def find_element(item: WebDriver | WebElement, key: str, *, by: str = By.CSS_SELECTOR) -> WebElement | None:
+def find_element(
+    item: WebDriver | WebElement, key: str, *, by: str = By.CSS_SELECTOR, wait_ready: bool = False
+) -> WebElement | None:
     """Find an element using a key from the selectors.yaml file. The key is used to get a CSS selector or a list of CSS selectors from the selectors.yaml file. The function tries each selector until it finds an element. If no element is found, it returns None.
 
     Args:
         item (WebDriver | WebElement): A Selenium WebDriver instance or a WebElement.
         key (str): Key from the selectors.yaml file.
         by (str, optional): Selenium By method. Defaults to By.CSS_SELECTOR.
+        wait_ready (bool, optional): Wait for the page to load first. Callers that have already awaited the page should leave this off; the readiness check costs a WebDriver round-trip per call. Defaults to False.
 
     Returns:
         WebElement | None: A Selenium WebElement or None.
     """
-    config: dict[str, Any] = ConfigValue(f"selectors.{key}").resolve()
-    if not config:
+    compiled = _compiled_selectors().get(key)
+    if compiled is None:
         return None
-    if isinstance(config, str):
-        config = [config]
 
-    wait_page_ready(item)
+    if wait_ready:
+        wait_page_ready(item)
 
-    for selector in config:
-        try:
-            element = item.find_element(by, selector)
-            return element
-        except NoSuchElementException:
-            logger.debug(f"Element not found: {key}: {selector}. Trying next selector.")
-            continue
+    element = _find_by_pairs(item, _lookup_pairs(compiled, by))
+    if element is not None:
+        return element
 
+    for _, selector in compiled.pairs:
+        logger.debug(f"Element not found: {key}: {selector}. Trying next selector.")
     logger.debug(f"Element not found: {key}")
     return None
 
@@ -110,24 +226,60 @@ def wait_element(item: WebDriver | WebElement, key: str, *, by: str = By.CSS_SEL
     Raises:
         NoSuchElementException: If the element is not found after the timeout.
     """
-    selectors: dict[str, Any] = ConfigValue("selectors").resolve()
-
-    config = selectors.get(key)
-    if not config:
+    compiled = _compiled_selectors().get(key)
+    if compiled is None:
         return
-    if isinstance(config, str):
-        config = [config]
 
-    for _ in range(0, timeout):
-        for selector in config:
-            try:
-                item.find_element(by, selector)
-                return
-            except NoSuchElementException:
-                continue
-        time.sleep(1)  # FIXME: Use WebDriverWait instead
+    pairs: tuple[tuple[str, str], ...] = _lookup_pairs(compiled, by)
+
+    try:
+        WebDriverWait(item, timeout, poll_frequency=0.2).until(lambda _: _find_by_pairs(item, pairs) is not None)
+    except TimeoutException as e:
+        raise NoSuchElementException(f"Element not found: {key}") from e
+
+
+def _lookup_pairs(compiled: _CompiledSelector, by: str) -> tuple[tuple[str, str], ...]:
+    """Build the (By, selector) lookup sequence for a compiled entry. For the default CSS lookup, all CSS selectors collapse into one comma-joined query followed by any XPath fallbacks; an explicit non-CSS `by` overrides the detected kinds.
+
+    Args:
+        compiled (_CompiledSelector): Compiled selector entry.
+        by (str): Selenium By method requested by the caller.
+
+    Returns:
+        tuple[tuple[str, str], ...]: (By, selector) tuples to try in order.
+    """
+    if by != By.CSS_SELECTOR:
+        return tuple((by, selector) for _, selector in compiled.pairs)
+    joined_first: tuple[tuple[str, str], ...] = ((By.CSS_SELECTOR, compiled.joined),) if compiled.joined else ()
+    return joined_first + tuple(pair for pair in compiled.pairs if pair[0] == By.XPATH)
+
+
+def _find_by_pairs(item: WebDriver | WebElement, pairs: tuple[tuple[str, str], ...]) -> WebElement | None:
+    """Find the first element matching any of the prepared (By, selector) pairs, without touching the config or logging. Shared by find_element and wait_element's polling predicate so selector resolution happens once in the caller.
+
+    Args:
+        item (WebDriver | WebElement): A Selenium WebDriver instance or a WebElement.
+        pairs (tuple[tuple[str, str], ...]): Prepared (By, selector) tuples.
 
-    raise NoSuchElementException(f"Element not found: {key}")
+    Returns:
+        WebElement | None: The first matching element or None.
+    """
+    for by, selector in pairs:
+        try:
+            return item.find_element(by, selector)
+        except NoSuchElementException:
+            continue
+    return None
+
+
+_FIND_ATTRIBUTE_JS = """
+const element = document.querySelector(arguments[0]);
+if (!element) {
+    return [false, null];
+}
+const value = element[arguments[1]];
+return [true, (value === undefined || value === null) ? element.getAttribute(arguments[1]) : value];
+"""
 
 
 def find_attribute(
@@ -150,12 +302,63 @@ def find_attribute(
     Returns:
         Any: Attribute value or default value.
     """
+    # Single-RPC fast path: querySelector + attribute read in one script call instead
+    # of separate find_element and get_attribute round-trips.
+    if by == By.CSS_SELECTOR and isinstance(item, WebDriver):
+        compiled = _compiled_selectors().get(key)
+        if compiled is None:
+            return default
+        if compiled.joined and len(compiled.pairs) == sum(1 for b, _ in compiled.pairs if b == By.CSS_SELECTOR):
+            found, value = item.execute_script(_FIND_ATTRIBUTE_JS, compiled.joined, attribute)  # type: ignore[no-untyped-call]
+            return value if found else default
+
     element = find_element(item, key, by=by)
     if element is None:
         return default
     return element.get_attribute(attribute)
 
 
+_FIND_ATTRIBUTES_JS = """
+const spec = arguments[0];
+const out = {};
+for (const [key, entry] of Object.entries(spec)) {
+    for (const selector of entry.selectors) {
+        const element = document.querySelector(selector);
+        if (element) {
+            const value = element[entry.attribute];
+            out[key] = (value === undefined || value === null) ? element.getAttribute(entry.attribute) : value;
+            break;
+        }
+    }
+}
+return out;
+"""
+
+
+def find_attributes(driver: WebDriver, spec: dict[str, tuple[str, str]]) -> dict[str, Any]:
+    """Find attributes for several selector keys with a single execute_script call. Each find_attribute call costs two WebDriver round-trips (find_element + get_attribute) plus a readiness check; batching in-browser collapses them into one.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+        spec (dict[str, tuple[str, str]]): Output key mapped to (selector key from the selectors.yaml file, attribute name).
+
+    Returns:
+        dict[str, Any]: Output key mapped to attribute value. Keys with no matching element are absent.
+    """
+    compiled = _compiled_selectors()
+    js_spec = {
+        key: {
+            "selectors": [selector for by, selector in compiled[selector_key].pairs if by == By.CSS_SELECTOR],
+            "attribute": attribute,
+        }
+        for key, (selector_key, attribute) in spec.items()
+        if selector_key in compiled
+    }
+    if not js_spec:
+        return {}
+    return driver.execute_script(_FIND_ATTRIBUTES_JS, js_spec) or {}  # type: ignore[no-untyped-call]
+
+
 def reject_cookies(driver: WebDriver) -> None:
     """Attempts to find and click a button on a web page to reject cookies using Selenium WebDriver. If the button is found, it clicks the button; otherwise, it does nothing.
 
@@ -182,7 +385,7 @@ def dismiss_popup(driver: WebDriver, keyword: str) -> None:
         driver (WebDriver): A Selenium WebDriver instance.
     """
     try:
-        popup_button = find_element(driver, keyword)
+        popup_button = find_element(driver, keyword, wait_ready=True)
         if popup_button is not None:
             popup_button.click()
     except StaleElementReferenceException:
@@ -199,6 +402,6 @@ def accept_cookies(driver: WebDriver) -> None:
     Args:
         driver (WebDriver): _description_
     """
-    cookies_button = find_element(driver, "accept_cookies")
+    cookies_button = find_element(driver, "accept_cookies", wait_ready=True)
     if cookies_button is not None:
         cookies_button.click()
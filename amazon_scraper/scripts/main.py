@@ -4,9 +4,6 @@ import click
 from loguru import logger
 
 from amazon_scraper.configuration import ConfigStore, ConfigValue  # type: ignore[attr-defined]
-from amazon_scraper.workflow import scrape_workflow
-
-ConfigStore.configure_context(source='config/config.yml')
 
 
 @click.command()
@@ -19,6 +16,14 @@ def main(domain: str, keyword: str) -> None:
         domain (str): The domain to scrape.
         keyword (str): The keyword to search for.
     """
+    # Deferred: pulls in the selenium/requests import graph, which would otherwise
+    # be paid even for --help.
+    from amazon_scraper.workflow import scrape_workflow  # pylint: disable=import-outside-toplevel
+
+    # Configured here rather than at import time so --help and test collection
+    # do not pay for the YAML parse.
+    ConfigStore.configure_context(source='config/config.yml')
+
     options: dict[str, Any] = ConfigValue("options").resolve()
 
     domains: list[str] = [domain] if domain else ConfigValue("payload.domains").resolve()
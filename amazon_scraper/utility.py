@@ -1,24 +1,44 @@
+import functools
+import os
+import pickle
+import random
 import time
 from typing import Any, Callable, Tuple, Type, Union
 
 import yaml
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings not available; fall back to the pure-Python loader
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+__all__ = ["retry", "load_yaml"]
+
 
 def retry(
     times: int,
     exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
     sleep: int = 0,
     default: Any = None,
+    *,
+    base_delay: float | None = None,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
+    unrecoverable: Tuple[Type[Exception], ...] = (),
 ) -> Callable[..., Any]:
     """
-    Retry decorator to retry a function call if it raises an exception.
+    Retry decorator to retry a function call if it raises an exception. With `base_delay` set, the wait between attempts grows exponentially with random jitter (capped at `max_delay`), so quickly clearing failures retry fast while persistent ones back off instead of hammering the remote. `sleep` keeps the old constant schedule and takes precedence when both are given.
 
     Args:
         times (int): Number of times to retry.
         exceptions (Union[Type[Exception], Tuple[Type[Exception], ...]], optional): Exceptions to catch. Defaults to Exception.
-        sleep (int, optional): Time to sleep between retries. Defaults to 0.
+        sleep (int, optional): Constant time to sleep between retries (deprecated in favor of base_delay). Defaults to 0.
         default (Any, optional): Default value to return if all retries fail. Defaults to None.
+        base_delay (float | None, optional): First-retry delay in seconds for exponential backoff; None disables backoff. Defaults to None.
+        max_delay (float, optional): Upper bound on the backoff delay in seconds. Defaults to 30.0.
+        jitter (float, optional): Random factor added to each delay (delay * (1 + uniform(0, jitter))). Defaults to 0.5.
+        unrecoverable (Tuple[Type[Exception], ...], optional): Exceptions that will never succeed on retry (e.g. programmer errors) and are re-raised immediately without burning the retry budget. Defaults to ().
 
     Returns:
         Callable[..., Any]: The decorated function.
@@ -36,26 +56,36 @@ def retry(
         exceptions = (exceptions,)
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if times <= 1:
+            # No retries requested: skip the wrapper entirely so every call avoids
+            # an extra frame and the try/except machinery.
+            return func
+
+        func_name: str = func.__name__ if hasattr(func, '__name__') else type(func).__name__
+
         def fx(*args: Any, **kwargs: Any) -> Any:
-            attempt: int = 0
-            while attempt < times:
+            # Bound per call (not at decoration) so tests patching time.sleep still
+            # intercept; attempts then use plain local lookups.
+            _sleep: Callable[[float], None] = time.sleep
+            _uniform: Callable[[float, float], float] = random.uniform
+            for attempt in range(times):
                 try:
                     return func(*args, **kwargs)
+                except unrecoverable:
+                    raise
                 except exceptions:  # pylint: disable=broad-exception-caught, catching-non-exception
-                    if hasattr(func, '__name__'):
-                        func_name = func.__name__
-                    else:
-                        func_name = type(func).__name__
-
-                    logger.warning(f'Exception thrown running {func_name}, attempt {attempt} of {times}')
-                    attempt += 1
-                    if attempt == times:
-                        logger.error(f'Failed to run {func_name} after {times} attempts')
+                    # Positional args defer formatting to loguru without per-attempt closures.
+                    logger.warning('Exception thrown running {}, attempt {} of {}', func_name, attempt, times)
+                    if attempt + 1 == times:
+                        logger.error('Failed to run {} after {} attempts', func_name, times)
                         if default is None:
                             raise
                         return default
                     if sleep:
-                        time.sleep(sleep)
+                        _sleep(sleep)
+                    elif base_delay is not None:
+                        delay: float = min(max_delay, base_delay * (2**attempt) * (1 + _uniform(0, jitter)))
+                        _sleep(delay)
             return default
 
         return fx
@@ -63,8 +93,45 @@ def retry(
     return decorator
 
 
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(document: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on (path, mtime, size) so an unchanged file is parsed at most once per process. A pickle sidecar (document + '.pkl') is kept across processes: unpickling is much faster than a YAML parse, so later runs skip the parse entirely as long as the sidecar's stored (mtime_ns, size) header still matches the source file.
+
+    Args:
+        document (str): Document path.
+        mtime_ns (int): Modification time of the document in nanoseconds, part of the cache key.
+        size (int): Size of the document in bytes, part of the cache key.
+
+    Returns:
+        Any: Data from the YAML file.
+    """
+    sidecar: str = f"{document}.pkl"
+    stamp: tuple[int, int] = (mtime_ns, size)
+    try:
+        with open(sidecar, "rb") as f:
+            header, data = pickle.load(f)
+        if header == stamp:
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    # One read() syscall for the whole (small) file; the loader decodes UTF-8 itself.
+    with open(document, "rb") as f:
+        data = yaml.load(f.read(), Loader=_YamlLoader)
+
+    try:
+        with open(f"{sidecar}.tmp", "wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{sidecar}.tmp", sidecar)
+    except (OSError, pickle.PicklingError):
+        # Read-only location or data that pickle cannot represent; the cache is optional.
+        pass
+
+    return data
+
+
 def load_yaml(document: str, subset: str | list[str] | None = None) -> Any:
-    """Get data from a YAML file. Optionally, get a subset of the data. Subset is a string or a list of keys.
+    """Get data from a YAML file. Optionally, get a subset of the data. Subset is a string or a list of keys. Parses are cached per (path, mtime); callers share the parsed structure and should not mutate it.
 
     Args:
         document (str): Document path.
@@ -73,14 +140,10 @@ def load_yaml(document: str, subset: str | list[str] | None = None) -> Any:
     Returns:
         Any: Data from the YAML file.
     """
-    with open(document, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-        if subset is not None:
-            if isinstance(subset, str):
-                subset = [subset]
-            for key in subset:
-                data = data.get(key)
-                if data is None:
-                    break
-            return data
+    st: os.stat_result = os.stat(document)
+    data = _load_yaml_cached(document, st.st_mtime_ns, st.st_size)
+    if subset is None:
         return data
+    if isinstance(subset, str):
+        subset = [subset]
+    return functools.reduce(lambda d, key: d.get(key) if isinstance(d, dict) else None, subset, data)
@@ -1,11 +1,19 @@
-import glob
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
 import shutil
+import threading
 import time
-from typing import Any
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Iterator
 
 from loguru import logger
 
 from amazon_scraper.amazon_scraper import (
+    discard_created_dirs,
     export_reviews,
     save_description_images,
     save_full_page_screenshots,
@@ -15,6 +23,127 @@ from amazon_scraper.amazon_scraper import (
 )
 from amazon_scraper.configuration import ConfigValue  # type: ignore[attr-defined]
 
+# Module-level instance so its memoized resolve() is shared across workflow calls;
+# the cache invalidates itself when the config context changes.
+_TARGET_FOLDER: ConfigValue = ConfigValue("payload.target_folder", mandatory=True)
+
+
+@functools.cache
+def _today() -> str:
+    """Today's date stamp, fixed at first use so a batch run crossing midnight keeps writing to the same folders.
+
+    Returns:
+        str: Date formatted as YYYYMMDD.
+    """
+    return time.strftime('%Y%m%d')
+
+
+def _search_cache_path(target_root: str, key: tuple[Any, ...]) -> str:
+    """Build the on-disk cache path for a search result set.
+
+    Args:
+        target_root (str): Root folder containing scrape output folders.
+        key (tuple[Any, ...]): Values identifying the search (base URL, keyword, limits, date).
+
+    Returns:
+        str: Path of the pickle file for this key.
+    """
+    digest: str = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+    return f"{target_root}/.search_cache/{digest}.pkl"
+
+
+def _load_cached_search(path: str) -> list[dict[str, Any]] | None:
+    """Load cached search results, or None when absent or unreadable.
+
+    Args:
+        path (str): Path of the pickle file.
+
+    Returns:
+        list[dict[str, Any]] | None: The cached results, or None on a cache miss.
+    """
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _store_cached_search(path: str, results: list[dict[str, Any]]) -> None:
+    """Store search results on disk, atomically and best-effort.
+
+    Args:
+        path (str): Path of the pickle file.
+        results (list[dict[str, Any]]): Search results to cache.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{path}.tmp", path)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+@contextlib.contextmanager
+def _workflow_log_sinks(output_directory: str, levels: list[str]) -> Iterator[None]:
+    """Install one log file sink per level for the duration of a workflow. Sinks are enqueued so log writes happen on loguru's worker thread instead of blocking the scraping threads, and are buffered to cut write syscalls.
+
+    Args:
+        output_directory (str): Directory to write the log files to.
+        levels (list[str]): Log levels to install sinks for.
+    """
+    logger_ids: list[int] = [
+        logger.add(f"{output_directory}/{level}.log", level=level.upper(), enqueue=True, buffering=1 << 16)
+        for level in levels
+    ]
+    try:
+        yield
+    finally:
+        for logger_id in logger_ids:
+            logger.remove(logger_id)
+
+
+def _remove_folder(folder: str) -> None:
+    """Remove a folder without blocking the caller. The folder is renamed aside instantly (so its name is free for the new scrape) and the recursive delete runs on a daemon thread; if the rename fails the delete happens inline instead.
+
+    Args:
+        folder (str): Folder to remove.
+    """
+    discard_created_dirs(folder)
+    trash: str = f"{folder}.trash-{os.getpid()}-{uuid.uuid4().hex}"
+    try:
+        os.rename(folder, trash)
+    except OSError:
+        shutil.rmtree(folder, ignore_errors=True)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}, daemon=True).start()
+
+
+def _existing_scrape_folders(target_root: str, keyword: str, domain: str) -> Iterator[str]:
+    """Find previous scrape folders for a keyword/domain pair with a single directory scan. Lazy so a caller that only needs to know whether any folder exists can stop at the first hit.
+
+    Args:
+        target_root (str): Root folder containing scrape output folders.
+        keyword (str): The keyword that was scraped.
+        domain (str): The domain that was scraped.
+
+    Yields:
+        str: Path of an existing `{keyword}_{domain}_*` folder; nothing if the root is missing.
+    """
+    prefix: str = f"{keyword}_{domain}_"
+    try:
+        entries = os.scandir(target_root)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if (
+                entry.name.startswith(prefix)
+                and ".trash-" not in entry.name  # renamed-aside folders pending background deletion
+                and entry.is_dir(follow_symlinks=False)
+            ):
+                yield entry.path
+
 
 def scrape_workflow(options: dict[str, Any], keyword: str, domain: str, force: bool = False) -> None:
     """Scrape Amazon for a given keyword and domain.
@@ -27,59 +156,111 @@ def scrape_workflow(options: dict[str, Any], keyword: str, domain: str, force: b
     """
 
     base_url: str = f"https://www.amazon.{domain}"
-    target_root: str = ConfigValue("payload.target_folder", mandatory=True).resolve()
+    target_root: str = _TARGET_FOLDER.resolve()
+    output_directory: str = f"{target_root}/{keyword}_{domain}_{_today()}"
 
-    for folder in glob.glob(f"{target_root}/{keyword}_{domain}_*"):
-        if force:
+    if force:
+        for folder in _existing_scrape_folders(target_root, keyword, domain):
             logger.info(f"Force scraping {keyword} on {domain}: removing {folder}")
-            shutil.rmtree(folder, ignore_errors=True)
-        else:
+            _remove_folder(folder)
+    else:
+        for folder in _existing_scrape_folders(target_root, keyword, domain):
+            # Today's folder without a completion marker is a crashed run: resume
+            # into it (the search cache below skips the Selenium search). Anything
+            # else counts as already scraped.
+            if folder == output_directory and not os.path.exists(f"{folder}/.complete"):
+                logger.info(f"Resuming incomplete scrape of {keyword} on {domain} in {folder}")
+                continue
             logger.info(f"Skipping {keyword} on {domain} as it has already been scraped")
             return
+    # Created up front so the log sinks (and the threads they serve) never race on
+    # lazy directory creation at first write.
+    os.makedirs(output_directory, exist_ok=True)
 
-    output_directory: str = f"{target_root}/{keyword}_{domain}_{time.strftime('%Y%m%d')}"
+    with _workflow_log_sinks(output_directory, options.get("log_levels", [])):
+        try:
+            # Scrape. Results for a given search are stable within a day, so reruns
+            # after a partial failure reuse the cached set instead of redoing the
+            # Selenium phase; force runs always search afresh.
+            cache_path: str = _search_cache_path(
+                target_root,
+                (base_url, keyword, options.get("max_results"), options.get("max_search_result_pages"), _today()),
+            )
+            results = None if force else _load_cached_search(cache_path)
+            if results is None:
+                results = search_amazon(
+                    base_url,
+                    keyword,
+                    max_results=options.get("max_results"),
+                    max_search_result_pages=options.get("max_search_result_pages"),
+                    output_directory=output_directory,
+                    max_workers=options.get("max_workers") or 1,
+                )
+                if results:
+                    _store_cached_search(cache_path, results)
+            else:
+                logger.info(f"Using cached search results for {keyword} on {domain}")
 
-    logger_ids: set[int] = set()
-    for level in options.get("log_levels", []):
-        logger_ids.add(logger.add(f"{output_directory}/{level}.log", level=level.upper()))
+            if len(results) == 0:
+                logger.warning(f"No results found for {keyword} on {domain}")
+                return
 
-    try:
-        # Scrape
-        results = search_amazon(
-            base_url,
-            keyword,
-            max_results=options.get("max_results"),
-            max_search_result_pages=options.get("max_search_result_pages"),
-            output_directory=output_directory,
-        )
-
-        if len(results) == 0:
-            logger.warning(f"No results found for {keyword} on {domain}")
-            return
+            save_results(results, output_directory, base_url, keyword)
 
-        save_results(results, output_directory, base_url, keyword)
+            # Image downloads are network-bound while review scraping is browser-bound,
+            # so the downloads run on background threads and hide behind the Selenium work.
+            with ThreadPoolExecutor(max_workers=2) as image_executor:
+                image_futures = []
+                download_workers: int = options.get("max_download_workers") or 16
+                if options.get("save_images"):
+                    logger.info("Saving images")
+                    image_futures.append(
+                        image_executor.submit(
+                            save_images_from_results,
+                            results,
+                            output_directory,
+                            subdir_key="sort_id",
+                            max_workers=download_workers,
+                        )
+                    )
 
-        if options.get("save_images"):
-            logger.info("Saving images")
-            save_images_from_results(results, output_directory, subdir_key="sort_id")
+                if options.get("save_description_images"):
+                    logger.info("Saving description images")
+                    image_futures.append(
+                        image_executor.submit(
+                            save_description_images,
+                            results,
+                            output_directory,
+                            subdir_key="sort_id",
+                            max_workers=download_workers,
+                        )
+                    )
 
-        if options.get("save_description_images"):
-            logger.info("Saving description images")
-            save_description_images(results, output_directory, subdir_key="sort_id")
+                if options.get("save_full_page_images"):
+                    logger.info("Saving full page images")
+                    save_full_page_screenshots(output_directory, results, max_workers=options.get("max_workers") or 4)
 
-        if options.get("save_full_page_images"):
-            logger.info("Saving full page images")
-            save_full_page_screenshots(output_directory, results)
+                if sentiments := options.get("export_reviews", []):
+                    # Each sentiment is an independent pass with its own driver, so they can
+                    # run side by side instead of back to back.
+                    with ThreadPoolExecutor(max_workers=min(4, len(sentiments))) as executor:
+                        futures = {
+                            executor.submit(export_reviews, results, output_directory, sentiment=sentiment): sentiment
+                            for sentiment in sentiments
+                        }
+                        for future in as_completed(futures):
+                            future.result()
+                            logger.info(f"Exported {futures[future]} reviews")
 
-        for sentiment in options.get("export_reviews", []):
-            logger.info(f"Exporting {sentiment} reviews")
-            export_reviews(results, output_directory, sentiment=sentiment)
+                for image_future in image_futures:
+                    image_future.result()
 
-        logger.success(f"Finished scraping {keyword} on {domain}")
+            # Marks the folder as finished; a rerun that finds it resumes only
+            # when the marker is missing.
+            with open(f"{output_directory}/.complete", "w", encoding="utf-8"):
+                pass
 
-    except Exception as e:  # pylint: disable=broad-except
-        logger.exception(f"ABORTED Error scraping {keyword} on {domain}: {e}")
+            logger.success(f"Finished scraping {keyword} on {domain}")
 
-    finally:
-        for logger_id in logger_ids:
-            logger.remove(logger_id)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.exception(f"ABORTED Error scraping {keyword} on {domain}: {e}")
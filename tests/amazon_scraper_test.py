@@ -1,10 +1,19 @@
+import io
 import logging
+from unittest.mock import Mock
 
 import pytest
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
 
-from amazon_scraper.amazon_scraper import get_image_urls, get_product_info, get_products, get_search_result_pages
+from amazon_scraper.amazon_scraper import (
+    _download_one,
+    _get_etag_cache,
+    get_image_urls,
+    get_product_info,
+    get_products,
+    get_search_result_pages,
+)
 
 
 @pytest.fixture
@@ -16,6 +25,40 @@ def driver():
     driver.quit()
 
 
+class TestDownloadOne:
+    def test_download_writes_file_and_records_validators(self, tmp_path):
+        response = Mock(status_code=200, raw=io.BytesIO(b"image-bytes"))
+        response.headers = {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        session = Mock(get=Mock(return_value=response))
+        path = tmp_path / "image.jpg"
+        cache = {}
+
+        _download_one(session, "https://example.com/image.jpg", str(path), cache=cache)
+
+        assert path.read_bytes() == b"image-bytes"
+        assert cache["https://example.com/image.jpg"] == ('"abc"', "Mon, 01 Jan 2024 00:00:00 GMT")
+        assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+
+    def test_conditional_request_skips_unmodified_image(self, tmp_path):
+        path = tmp_path / "image.jpg"
+        path.write_bytes(b"old-bytes")
+        cache = {"https://example.com/image.jpg": ('"abc"', "Mon, 01 Jan 2024 00:00:00 GMT")}
+        session = Mock(get=Mock(return_value=Mock(status_code=304)))
+
+        _download_one(session, "https://example.com/image.jpg", str(path), cache=cache)
+
+        headers = session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert path.read_bytes() == b"old-bytes"
+
+    def test_etag_cache_is_shared_per_directory(self, tmp_path):
+        cache = _get_etag_cache(str(tmp_path))
+        cache["https://example.com/image.jpg"] = ('"abc"', None)
+
+        assert _get_etag_cache(str(tmp_path)) is cache
+
+
 @pytest.mark.web
 class TestGetSearchResultPages:
     @pytest.mark.slow
@@ -106,7 +149,7 @@ class TestGetProducts:
         filename = "test_page.png"
         screenshot_path = tmp_path / filename
 
-        mocker.patch('selenium.webdriver.remote.webdriver.WebDriver.find_elements', return_value=[])
+        mocker.patch('amazon_scraper.amazon_scraper._extract_products', return_value=[])
 
         products = get_products(driver, page_url, base_url, filename=str(screenshot_path))
 
@@ -116,13 +159,13 @@ class TestGetProducts:
         assert screenshot_path.stat().st_size > 0
 
     @pytest.mark.slow
-    def test_get_products_with_no_such_element_exception(self, driver, mocker, caplog, tmp_path):
+    def test_get_products_with_webdriver_exception(self, driver, mocker, caplog, tmp_path):
         base_url = "https://www.amazon.com"
         page_url = "https://www.amazon.com/s?k=laptop"
         filename = "test_page.png"
         screenshot_path = tmp_path / filename
 
-        mocker.patch('amazon_scraper.scrape_utility.find_attribute', side_effect=NoSuchElementException)
+        mocker.patch('amazon_scraper.amazon_scraper._extract_products', side_effect=WebDriverException)
 
         with caplog.at_level(logging.INFO):
             products = get_products(driver, page_url, base_url, filename=str(screenshot_path))
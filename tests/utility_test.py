@@ -51,6 +51,26 @@ class TestRetry:
         assert mock_sleep.call_count == 1
         assert f"Exception thrown running {type(mock_func).__name__}, attempt 0 of 3" in caplog.text
 
+    def test_retry_with_exponential_backoff(self):
+        mock_func = Mock(side_effect=[Exception("fail"), Exception("fail"), "success"])
+        decorated_func = retry(times=3, base_delay=1.0, jitter=0)(mock_func)
+
+        with patch("time.sleep", return_value=None) as mock_sleep:
+            result = decorated_func()
+
+        assert result == "success"
+        assert mock_func.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    def test_retry_unrecoverable_exception_raises_immediately(self):
+        mock_func = Mock(side_effect=TypeError("bug"))
+        decorated_func = retry(times=3, unrecoverable=(TypeError,))(mock_func)
+
+        with pytest.raises(TypeError, match="bug"):
+            decorated_func()
+
+        assert mock_func.call_count == 1
+
     def test_retry_raises_exception(self, caplog):
         mock_func = Mock(side_effect=Exception("fail"))
         decorated_func = retry(times=3)(mock_func)